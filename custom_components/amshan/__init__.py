@@ -22,8 +22,13 @@ from .const import (
     CONF_CONNECTION_TYPE,
     CONF_MQTT_TOPICS,
     CONF_TCP_HOST,
+    MEASURE_QUEUE_MAX_SIZE,
+)
+from .metercon import (
+    MeasureQueue,
+    async_setup_meter_mqtt_subscriptions,
+    setup_meter_connection,
 )
-from .metercon import async_setup_meter_mqtt_subscriptions, setup_meter_connection
 
 if TYPE_CHECKING:
     import datetime as dt
@@ -62,7 +67,9 @@ class AmsHanIntegration:
         self._mqtt_unsubscribe: CALLBACK_TYPE | None = None
         self._listeners: list[CALLBACK_TYPE] = []
         self._tasks: list[asyncio.Task] = []
-        self.measure_queue: asyncio.Queue[han_type.MeterMessageBase] = asyncio.Queue()
+        self.measure_queue: asyncio.Queue[han_type.MeterMessageBase] = MeasureQueue(
+            MEASURE_QUEUE_MAX_SIZE
+        )
 
     async def async_setup_receiver(
         self, hass: HomeAssistant, config_data: Mapping
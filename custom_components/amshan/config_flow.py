@@ -39,7 +39,7 @@ from .const import (
     DOMAIN,  # pylint: disable=unused-import
     HOSTNAME_IP4_IP6_REGEX,
 )
-from .metercon import get_connection_factory, get_meter_message
+from .metercon import get_connection_factory, get_meter_message, get_mqtt_topics
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigFlowResult
@@ -415,13 +415,15 @@ class ConfigFlowValidation:
             if meter_message:
                 measure_queue.put_nowait(meter_message)
 
-        topics = {x.strip() for x in user_input[CONF_MQTT_TOPICS].split(",")}
-        unsubscibers = [
-            await mqtt.client.async_subscribe(
-                hass, topic, message_received, 1, encoding=None
+        topics = get_mqtt_topics(user_input)
+        unsubscibers = await asyncio.gather(
+            *(
+                mqtt.client.async_subscribe(
+                    hass, topic, message_received, 1, encoding=None
+                )
+                for topic in topics
             )
-            for topic in topics
-        ]
+        )
 
         try:
             return await self._async_get_meter_info(measure_queue)
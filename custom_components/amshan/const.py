@@ -47,3 +47,7 @@ CONF_TCP_PORT = ha_const.CONF_PORT
 CONF_MQTT_TOPICS = "mqtt_topics"
 
 CONF_OPTIONS_SCALE_FACTOR = "scale_factor"
+
+# Max number of received meter messages waiting to be processed. The oldest
+# message is dropped when the queue is full.
+MEASURE_QUEUE_MAX_SIZE = 1024
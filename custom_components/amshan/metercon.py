@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
+import re
+from binascii import unhexlify
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
 from han import (
@@ -22,6 +25,7 @@ from han import (
 )
 from homeassistant.components import mqtt
 from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.util.json import json_loads
 
 from .const import (
     CONF_MQTT_TOPICS,
@@ -38,12 +42,50 @@ from .const import (
 )
 
 if TYPE_CHECKING:
-    import asyncio
     from collections.abc import Mapping
 
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
+# Comma and surrounding whitespace between topics in MQTT topics config
+_TOPIC_SEPARATOR_REGEX = re.compile(r"\s*,\s*")
+
+# Log a warning for the first and then every n-th dropped message
+_DROPPED_MESSAGES_LOG_INTERVAL = 100
+
+_MESSAGE_TYPE_P1 = han_type.MeterMessageType.P1
+_DlmsMessage = han_type.DlmsMessage
+_HDLC_FLAG_SEQUENCE = hdlc.HdlcFrameReader.FLAG_SEQUENCE.to_bytes(1, byteorder="big")
+
+_HEX_BYTES = frozenset(b"0123456789abcdefABCDEF")
+# All byte values that are not ASCII hex digits. Used to validate hex payloads
+# with bytes.translate instead of converting the whole payload to an int.
+_NON_HEX_BYTES = bytes(b for b in range(256) if b not in _HEX_BYTES)
+
+
+class MeasureQueue(asyncio.Queue[han_type.MeterMessageBase]):
+    """Measure queue that drops the oldest message when full."""
+
+    def __init__(self, maxsize: int) -> None:
+        """Initialize MeasureQueue."""
+        super().__init__(maxsize)
+        self._dropped_count = 0
+
+    def put_nowait(self, item: han_type.MeterMessageBase) -> None:
+        """Put message into the queue, dropping the oldest message if full."""
+        if self.full():
+            # Processing does not keep up. Drop the oldest message.
+            self.get_nowait()
+            self.task_done()
+            self._dropped_count += 1
+            if self._dropped_count % _DROPPED_MESSAGES_LOG_INTERVAL == 1:
+                _LOGGER.warning(
+                    "Measure queue is full (%d messages). Dropped %d message(s).",
+                    self.maxsize,
+                    self._dropped_count,
+                )
+        super().put_nowait(item)
+
 
 def setup_meter_connection(
     loop: asyncio.AbstractEventLoop,
@@ -61,9 +103,10 @@ def get_connection_factory(
     measure_queue: asyncio.Queue[han_type.MeterMessageBase],
 ) -> meter_connection.AsyncConnectionFactory:
     """Get connection factory based on configured connection type."""
-
-    async def tcp_connection_factory() -> meter_connection.MeterTransportProtocol:
-        return await han_tcp.create_tcp_message_connection(
+    # select tcp or serial connection factory, and read the config only once
+    if CONF_TCP_HOST in config:
+        return partial(
+            han_tcp.create_tcp_message_connection,
             measure_queue,
             loop,
             None,
@@ -71,24 +114,19 @@ def get_connection_factory(
             port=config[CONF_TCP_PORT],
         )
 
-    async def serial_connection_factory() -> meter_connection.MeterTransportProtocol:
-        return await han_serial.create_serial_message_connection(
-            measure_queue,
-            loop,
-            None,
-            url=config[CONF_SERIAL_PORT],
-            baudrate=config[CONF_SERIAL_BAUDRATE],
-            parity=config[CONF_SERIAL_PARITY],
-            bytesize=config[CONF_SERIAL_BYTESIZE],
-            stopbits=float(config[CONF_SERIAL_STOPBITS]),
-            xonxoff=config[CONF_SERIAL_XONXOFF],
-            rtscts=config[CONF_SERIAL_RTSCTS],
-            dsrdtr=config[CONF_SERIAL_DSRDTR],
-        )
-
-    # select tcp or serial connection factory
-    return (
-        tcp_connection_factory if CONF_TCP_HOST in config else serial_connection_factory
+    return partial(
+        han_serial.create_serial_message_connection,
+        measure_queue,
+        loop,
+        None,
+        url=config[CONF_SERIAL_PORT],
+        baudrate=config[CONF_SERIAL_BAUDRATE],
+        parity=config[CONF_SERIAL_PARITY],
+        bytesize=config[CONF_SERIAL_BYTESIZE],
+        stopbits=float(config[CONF_SERIAL_STOPBITS]),
+        xonxoff=config[CONF_SERIAL_XONXOFF],
+        rtscts=config[CONF_SERIAL_RTSCTS],
+        dsrdtr=config[CONF_SERIAL_DSRDTR],
     )
 
 
@@ -102,32 +140,34 @@ async def async_setup_meter_mqtt_subscriptions(
     @callback
     def message_received(mqtt_message: mqtt.models.ReceiveMessage) -> None:
         """Handle new MQTT messages."""
-        _LOGGER.debug(
-            (
-                "Message with timestamp %s, QOS %d, retain flagg %s, "
-                "and payload length %d received "
-                "from topic %s from subscription to topic %s"
-            ),
-            mqtt_message.timestamp,
-            mqtt_message.qos,
-            bool(mqtt_message.retain),
-            len(mqtt_message.payload),
-            mqtt_message.topic,
-            mqtt_message.subscribed_topic,
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                (
+                    "Message with timestamp %s, QOS %d, retain flagg %s, "
+                    "and payload length %d received "
+                    "from topic %s from subscription to topic %s"
+                ),
+                mqtt_message.timestamp,
+                mqtt_message.qos,
+                bool(mqtt_message.retain),
+                len(mqtt_message.payload),
+                mqtt_message.topic,
+                mqtt_message.subscribed_topic,
+            )
         meter_message = get_meter_message(mqtt_message)
         if meter_message:
             measure_queue.put_nowait(meter_message)
 
-    topics = {x.strip() for x in config[CONF_MQTT_TOPICS].split(",")}
+    topics = get_mqtt_topics(config)
 
     _LOGGER.debug("Try to subscribe to %d MQTT topic(s): %s", len(topics), topics)
-    unsubscibers = [
-        await mqtt.client.async_subscribe(
-            hass, topic, message_received, 1, encoding=None
+    # subscribe concurrently to avoid one broker round-trip per topic
+    unsubscibers = await asyncio.gather(
+        *(
+            mqtt.client.async_subscribe(hass, topic, message_received, 1, encoding=None)
+            for topic in topics
         )
-        for topic in topics
-    ]
+    )
     _LOGGER.debug(
         "Successfully subscribed to %d MQTT topic(s): %s", len(topics), topics
     )
@@ -141,6 +181,12 @@ async def async_setup_meter_mqtt_subscriptions(
     return unsubscribe_mqtt
 
 
+def get_mqtt_topics(config: Mapping[str, Any]) -> tuple[str, ...]:
+    """Get unique, non-empty MQTT topics from comma separated topics config."""
+    topics = _TOPIC_SEPARATOR_REGEX.split(config[CONF_MQTT_TOPICS].strip())
+    return tuple(dict.fromkeys(topic for topic in topics if topic))
+
+
 def get_meter_message(
     mqtt_message: mqtt.models.ReceiveMessage,
 ) -> han_type.MeterMessageBase | None:
@@ -149,124 +195,148 @@ def get_meter_message(
 
     # payload should always be bytes when encoding is None in async_subscribe
     payload: bytes = mqtt_message.payload  # type: ignore[attr-defined]
+    topic = mqtt_message.topic
     message = _try_read_meter_message(payload)
     if message is not None:
-        if message.message_type == han_type.MeterMessageType.P1:
-            if message.is_valid:
-                _LOGGER.debug(
+        # is_valid is a computed property (checksum validation for HDLC-frames)
+        is_valid = message.is_valid
+        if message.message_type is _MESSAGE_TYPE_P1:
+            if is_valid:
+                _debug_payload(
                     "Got valid P1 message from topic %s: %s",
-                    mqtt_message.topic,
-                    payload.hex(),
+                    topic,
+                    payload,
                 )
                 return message
 
-            _LOGGER.debug(
+            _debug_payload(
                 "Got invalid P1 message from topic %s: %s",
-                mqtt_message.topic,
-                payload.hex(),
+                topic,
+                payload,
             )
 
             return None
 
-        if message.is_valid:
+        if is_valid:
             if message.payload is not None:
-                _LOGGER.debug(
+                _debug_payload(
                     (
                         "Got valid frame of expected length with correct "
                         "checksum from topic %s: %s"
                     ),
-                    mqtt_message.topic,
-                    payload.hex(),
+                    topic,
+                    payload,
                 )
                 return message
 
-            _LOGGER.debug(
+            _debug_payload(
                 (
                     "Got empty frame of expected length with correct "
                     "checksum from topic %s: %s"
                 ),
-                mqtt_message.topic,
-                payload.hex(),
+                topic,
+                payload,
             )
 
-        _LOGGER.debug(
+        _debug_payload(
             "Got invalid frame from topic %s: %s",
-            mqtt_message.topic,
-            payload.hex(),
+            topic,
+            payload,
         )
         return None
 
-    try:
-        json_data = json.loads(mqtt_message.payload)
-        if isinstance(json_data, dict):
-            _LOGGER.debug(
-                "Ignore JSON in payload without HDLC framing from topic %s: %s",
-                mqtt_message.topic,
-                json_data,
-            )
-            return None
-    except ValueError:
-        pass
+    # Only JSON objects are ignored, and they always start with "{" (optionally
+    # after whitespace). Skip the parser for binary and hex payloads.
+    if payload.lstrip(b" \t\r\n")[:1] == b"{":
+        try:
+            json_data = json_loads(payload)
+            if isinstance(json_data, dict):
+                _LOGGER.debug(
+                    "Ignore JSON in payload without HDLC framing from topic %s: %s",
+                    topic,
+                    json_data,
+                )
+                return None
+        except ValueError:
+            pass
 
-    _LOGGER.debug(
+    _debug_payload(
         "Got payload without HDLC framing from topic %s: %s",
-        mqtt_message.topic,
-        payload.hex(),
+        topic,
+        payload,
     )
 
     # Try message containing DLMS (binary) message without HDLC framing
     # Some bridges encode the binary data as hex string, and this must be decoded
     if _is_hex_string(payload):
         payload = _hex_payload_to_binary(payload)
-    return han_type.DlmsMessage(payload)
+    return _DlmsMessage(payload)
+
+
+def _debug_payload(msg: str, topic: str, payload: bytes) -> None:
+    # Avoid hex formatting the payload for log messages that are discarded anyway
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug(msg, topic, payload.hex())
 
 
 def _try_read_meter_message(payload: bytes) -> han_type.MeterMessageBase | None:
-    """Try to parse HDLC-frame from payload."""
+    """Try to parse P1 readout or HDLC-frame from payload."""
     if payload.startswith(b"/"):
-        try:
-            return dlde.DataReadout(payload)
-        except ValueError as ex:
-            _LOGGER.debug("Starts with '/', but not a valid P1 message: %s", ex)
+        # neither HDLC-frames nor hex strings can start with '/'
+        return _try_read_p1_message(payload)
 
-    frame_reader = hdlc.HdlcFrameReader(
-        use_octet_stuffing=False, use_abort_sequence=False
-    )
+    frames = _read_hdlc_frames(payload)
+    if frames:
+        return frames[0]
 
-    # Reader expects flag sequence in start and end.
-    flag_seqeuence = hdlc.HdlcFrameReader.FLAG_SEQUENCE.to_bytes(1, byteorder="big")
-    if not payload.startswith(flag_seqeuence):
-        frame_reader.read(flag_seqeuence)
+    if not _is_hex_string(payload):
+        return None
 
-    frames = frame_reader.read(payload)
-    if len(frames) == 0:
-        # add flag sequence to the end
-        frames = frame_reader.read(flag_seqeuence)
+    # Some bridges encode the P1 readout or binary HDLC-frame as hex string
+    decoded = _hex_payload_to_binary(payload)
+    if decoded.startswith(b"/"):
+        return _try_read_p1_message(decoded)
 
-    if len(frames) > 0:
-        return frames[0]
+    frames = _read_hdlc_frames(decoded)
+    return frames[0] if frames else None
 
-    if not _is_hex_string(payload):
+
+def _try_read_p1_message(payload: bytes) -> dlde.DataReadout | None:
+    try:
+        return dlde.DataReadout(payload)
+    except ValueError as ex:
+        _LOGGER.debug("Starts with '/', but not a valid P1 message: %s", ex)
         return None
 
-    return _try_read_meter_message(_hex_payload_to_binary(payload))
+
+def _read_hdlc_frames(payload: bytes) -> list[hdlc.HdlcFrame]:
+    frame_reader = hdlc.HdlcFrameReader(
+        use_octet_stuffing=False, use_abort_sequence=False
+    )
+
+    # Reader expects flag sequence in start and end.
+    data = payload
+    if not data.startswith(_HDLC_FLAG_SEQUENCE):
+        data = _HDLC_FLAG_SEQUENCE + data
+    if not data.endswith(_HDLC_FLAG_SEQUENCE):
+        data += _HDLC_FLAG_SEQUENCE
+
+    return frame_reader.read(data)
 
 
 def _is_hex_string(payload: bytes) -> bool:
-    if (len(payload) % 2) == 0:
-        try:
-            int(payload, 16)
-        except ValueError:
-            return False
-        else:
-            return True
-    return False
+    # some bridges add whitespace (like a line break) around the hex string
+    payload = payload.strip()
+    # reject binary payloads (HDLC-frames start with 0x7E) without a full scan
+    if not payload or payload[0] not in _HEX_BYTES:
+        return False
+    length = len(payload)
+    return (length % 2) == 0 and len(payload.translate(None, _NON_HEX_BYTES)) == length
 
 
 def _hex_payload_to_binary(payload: str | bytes) -> bytes:
-    if isinstance(payload, bytes):
-        return bytes.fromhex(payload.decode("utf8"))
-    if isinstance(payload, str):
-        return bytes.fromhex(payload)
+    # unhexlify accepts both bytes and ASCII str without an intermediate decode
+    if isinstance(payload, bytes | str):
+        return unhexlify(payload.strip())
     msg = f"Unsupported payload type: {type(payload)}"
     raise ValueError(msg)